@@ -18,7 +18,7 @@ import logging
 import os
 import warnings
 from random import sample
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from geti_sdk.data_models import Annotation, TaskType
 from geti_sdk.data_models.media import MediaInformation
@@ -62,8 +62,60 @@ class GetiAnnotationReader(AnnotationReader):
             task_type=task_type,
         )
         self._label_names_to_include = label_names_to_include
+        # Cache of the label names in each annotation file, mapping the file path to
+        # a tuple of the modification time of the file and its label names. Only the
+        # label names are kept, so that the full annotation data is not held in
+        # memory for the lifetime of the reader
+        self._label_names_per_file: Dict[str, Tuple[int, List[str]]] = {}
         self._normalized_annotations = self._has_normalized_annotations()
 
+    @staticmethod
+    def _read_annotation_file(filepath: str) -> Dict[str, Any]:
+        """
+        Read the json data from the annotation file at `filepath`.
+
+        The file is always decoded as UTF-8, since annotation files written by the
+        SDK contain any non-ASCII characters (for example in label names) as raw
+        UTF-8, regardless of the locale encoding of the system.
+
+        :param filepath: Path to the annotation file
+        :return: Dictionary holding the annotation data
+        """
+        with open(filepath, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _get_label_names_in_file(self, filepath: str) -> List[str]:
+        """
+        Return the unique label names used in the annotation file at `filepath`.
+
+        The label names are cached per file, since they are needed every time the
+        label names for the whole annotation folder are requested. The file is read
+        again if it was modified since it was last read.
+
+        :param filepath: Path to the annotation file
+        :return: List of unique label names in the annotation file, in order of
+            first appearance
+        """
+        modified_time_ns = os.stat(filepath).st_mtime_ns
+        cached_entry = self._label_names_per_file.get(filepath, None)
+        if cached_entry is not None and cached_entry[0] == modified_time_ns:
+            return cached_entry[1]
+        data = self._read_annotation_file(filepath)
+        annotations = data.get("annotations", None)
+        if annotations is None:
+            raise ValueError(
+                f"Annotation file '{filepath}' does not contain any "
+                f"annotations. Please make sure that this is a valid "
+                f"annotation file."
+            )
+        label_names: List[str] = []
+        for annotation in annotations:
+            for label in annotation["labels"]:
+                if label["name"] not in label_names:
+                    label_names.append(label["name"])
+        self._label_names_per_file[filepath] = (modified_time_ns, label_names)
+        return label_names
+
     def _get_label_names(self, all_labels: List[str]) -> List[str]:
         """
         Return the labels for the task type the annotation reader is currently set to.
@@ -102,9 +154,7 @@ class GetiAnnotationReader(AnnotationReader):
             )
             data = {"annotations": []}
         else:
-            filepath = filepath[0]
-            with open(filepath, "r") as f:
-                data = json.load(f)
+            data = self._read_annotation_file(filepath[0])
         return data
 
     def get_data(
@@ -178,20 +228,9 @@ class GetiAnnotationReader(AnnotationReader):
                 f"No valid annotation files were found in folder {self.base_folder}"
             )
         for annotation_file in annotation_files:
-            with open(annotation_file, "r") as f:
-                data = json.load(f)
-            annotations = data.get("annotations", None)
-            if annotations is None:
-                raise ValueError(
-                    f"Annotation file '{annotation_file}' does not contain any "
-                    f"annotations. Please make sure that this is a valid "
-                    f"annotation file."
-                )
-            for annotation in annotations:
-                labels = [label["name"] for label in annotation["labels"]]
-                for label in labels:
-                    if label not in unique_label_names:
-                        unique_label_names.append(label)
+            for label in self._get_label_names_in_file(annotation_file):
+                if label not in unique_label_names:
+                    unique_label_names.append(label)
         return unique_label_names
 
     def _has_normalized_annotations(self) -> bool:
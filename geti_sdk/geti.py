@@ -13,7 +13,6 @@
 # and limitations under the License.
 import logging
 import os
-import sys
 import time
 import warnings
 from typing import Dict, List, Optional, Sequence, Tuple, Union
@@ -58,6 +57,7 @@ from .rest_clients import (
     VideoClient,
 )
 from .utils import (
+    configure_basic_stdout_logging,
     generate_classification_labels,
     get_default_workspace_id,
     get_project_folder_name,
@@ -65,9 +65,9 @@ from .utils import (
     show_image_with_annotation_scene,
     show_video_frames_with_annotation_scenes,
 )
+from .utils.logging_helpers import DEFAULT_LOG_FORMAT
 
 DEFAULT_LOG_LEVEL = logging.INFO
-DEFAULT_LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
 
 
 class Geti:
@@ -128,12 +128,9 @@ class Geti:
         ] = None,
     ):
         # Set up default logging for the SDK.
-        if not logging.root.handlers:
-            logging.basicConfig(
-                handlers=[logging.StreamHandler(stream=sys.stdout)],
-                level=DEFAULT_LOG_LEVEL,
-                format=DEFAULT_LOG_FORMAT,
-            )
+        configure_basic_stdout_logging(
+            level=DEFAULT_LOG_LEVEL, log_format=DEFAULT_LOG_FORMAT
+        )
 
         # Validate input parameters
         if host is None and server_config is None:
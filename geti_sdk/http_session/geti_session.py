@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions
 # and limitations under the License.
 import logging
+import threading
 import time
 import warnings
 from json import JSONDecodeError
@@ -21,9 +22,11 @@ import requests
 import simplejson
 import urllib3
 from requests import Response
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 from requests.structures import CaseInsensitiveDict
 from urllib3.exceptions import InsecureRequestWarning
+from urllib3.util.retry import Retry
 
 from geti_sdk.platform_versions import GetiVersion
 
@@ -36,6 +39,22 @@ PROXY_COOKIE_NAME = "_oauth2_proxy"
 INITIAL_HEADERS = {"Connection": "keep-alive", "Upgrade-Insecure-Requests": "1"}
 SUCCESS_STATUS_CODES = [200, 201]
 
+# Connection pool settings for the HTTPAdapter mounted on the session. Connections to
+# the server are kept alive and re-used across requests, and requests that fail to
+# connect are retried with a small backoff.
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 32
+CONNECT_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.5
+
+CONTENT_TYPE_HEADERS: Dict[str, Dict[str, Optional[str]]] = {
+    "json": {"Content-Type": "application/json"},
+    "jpeg": {"Content-Type": "image/jpeg"},
+    "multipart": {"Content-Type": None},
+    "": {"Content-Type": None},
+    "zip": {"Content-Type": "application/zip"},
+}
+
 
 class GetiSession(requests.Session):
     """
@@ -53,12 +72,20 @@ class GetiSession(requests.Session):
     ):
         super().__init__()
         self.headers.update(INITIAL_HEADERS)
+        self._mount_pooled_adapter()
         self.allow_redirects = False
         self.token = None
         self._cookies: Dict[str, Optional[str]] = {
             CSRF_COOKIE_NAME: None,
             PROXY_COOKIE_NAME: None,
         }
+        # Requests may be made from multiple threads. When the authentication
+        # expires, all requests in flight fail at once, so re-authentication is
+        # guarded by a lock. The generation counter is incremented on every
+        # re-authentication, so that threads that were waiting for the lock can tell
+        # that the credentials were already refreshed by another thread
+        self._authentication_lock = threading.Lock()
+        self._authentication_generation = 0
 
         # Configure proxies
         if server_config.proxies is None:
@@ -93,6 +120,30 @@ class GetiSession(requests.Session):
         # Get server version
         self._product_info = self._get_product_info_and_set_api_version()
 
+    def _mount_pooled_adapter(self) -> None:
+        """
+        Mount an HTTPAdapter with a connection pool on the session, so that
+        connections to the server are re-used across consecutive (or concurrent)
+        requests rather than being re-established for every request.
+        """
+        retry_strategy = Retry(
+            total=CONNECT_RETRIES,
+            connect=CONNECT_RETRIES,
+            read=0,
+            redirect=0,
+            status=0,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            raise_on_redirect=False,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=retry_strategy,
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
     @property
     def version(self) -> GetiVersion:
         """
@@ -183,8 +234,11 @@ class GetiSession(requests.Session):
                 f"failed, please provide a valid cluster hostname or ip address as"
                 f" well as valid login details."
             ) from error
-        self.headers.clear()
-        self.headers.update({"Content-Type": "application/x-www-form-urlencoded"})
+        # The session headers are replaced rather than modified in place, since
+        # requests from other threads may be merging them at the same time
+        self.headers = CaseInsensitiveDict(
+            {"Content-Type": "application/x-www-form-urlencoded"}
+        )
         if verbose:
             logging.info(f"Authenticating on host {self.config.host}...")
         response = self.post(
@@ -231,16 +285,10 @@ class GetiSession(requests.Session):
         if url.startswith(self.config.api_pattern):
             url = url[len(self.config.api_pattern) :]
 
-        if contenttype == "json":
-            self.headers.update({"Content-Type": "application/json"})
-        elif contenttype == "jpeg":
-            self.headers.update({"Content-Type": "image/jpeg"})
-        elif contenttype == "multipart":
-            self.headers.pop("Content-Type", None)
-        elif contenttype == "":
-            self.headers.pop("Content-Type", None)
-        elif contenttype == "zip":
-            self.headers.update({"Content-Type": "application/zip"})
+        # The content type is passed as a request-level header rather than stored on
+        # the session, so that requests with different content types can safely be
+        # made concurrently from multiple threads.
+        request_headers = CONTENT_TYPE_HEADERS.get(contenttype, {})
 
         requesturl = f"{self.config.base_url}{url}"
 
@@ -263,12 +311,14 @@ class GetiSession(requests.Session):
             "method": method,
             "url": requesturl,
             **kw_data_arg,
+            "headers": request_headers,
             "stream": True,
         }
 
         if not self.use_token:
             request_params.update({"cookies": self._cookies})
 
+        authentication_generation = self._authentication_generation
         try:
             response = self.request(**request_params, **self._proxies)
         except requests.exceptions.SSLError as error:
@@ -287,6 +337,7 @@ class GetiSession(requests.Session):
                 request_params=request_params,
                 request_data=kw_data_arg,
                 allow_reauthentication=allow_reauthentication,
+                authentication_generation=authentication_generation,
             )
 
         if response.headers.get("Content-Type", None) == "application/json":
@@ -397,6 +448,7 @@ class GetiSession(requests.Session):
         request_params: Dict[str, Any],
         request_data: Dict[str, Any],
         allow_reauthentication: bool = True,
+        authentication_generation: Optional[int] = None,
     ) -> Response:
         """
         Handle error responses from the server.
@@ -407,20 +459,38 @@ class GetiSession(requests.Session):
         :param allow_reauthentication: True to handle authentication errors
             by attempting to re-authenticate. If set to False, such errors
             will be raised instead.
+        :param authentication_generation: Authentication generation of the session
+            at the time the original request was made. If the session has
+            re-authenticated since then (for example from another thread), the
+            request is retried without authenticating again. If left as None, the
+            session always re-authenticates
         :raises: GetiRequestException in case the error cannot be handled
         :return: Response object resulting from the request
         """
         if response.status_code in [200, 401, 403] and allow_reauthentication:
             # Authentication has likely expired, re-authenticate
-            logging.info("Authentication may have expired, re-authenticating...")
-            if not self.use_token:
-                self.authenticate(verbose=False)
-                logging.info("Authentication complete.")
-
-            else:
-                access_token = self._acquire_access_token()
-                logging.info("New bearer token obtained.")
-                self.headers.update({"Authorization": f"Bearer {access_token}"})
+            with self._authentication_lock:
+                if (
+                    authentication_generation is None
+                    or authentication_generation == self._authentication_generation
+                ):
+                    logging.info(
+                        "Authentication may have expired, re-authenticating..."
+                    )
+                    if not self.use_token:
+                        self.authenticate(verbose=False)
+                        logging.info("Authentication complete.")
+
+                    else:
+                        access_token = self._acquire_access_token()
+                        logging.info("New bearer token obtained.")
+                        # Replace the session headers rather than modifying them in
+                        # place, since requests from other threads may be merging
+                        # them at the same time
+                        headers = self.headers.copy()
+                        headers.update({"Authorization": f"Bearer {access_token}"})
+                        self.headers = headers
+                    self._authentication_generation += 1
 
             # We make one attempt to do the request again. If it fails again, a
             # GetiRequestException will be raised holding further details of the
@@ -14,14 +14,15 @@
 import logging
 from typing import Generic, List, Optional, Sequence, Union
 
-from tqdm.auto import tqdm
-from tqdm.contrib.logging import logging_redirect_tqdm
-
 from geti_sdk.data_models import AnnotationScene, Image, Video, VideoFrame
 from geti_sdk.data_models.containers import MediaList
 from geti_sdk.http_session import GetiRequestException
 
-from .base_annotation_client import AnnotationReaderType, BaseAnnotationClient
+from .base_annotation_client import (
+    DEFAULT_MAX_WORKERS,
+    AnnotationReaderType,
+    BaseAnnotationClient,
+)
 
 
 class AnnotationClient(BaseAnnotationClient, Generic[AnnotationReaderType]):
@@ -49,7 +50,7 @@ class AnnotationClient(BaseAnnotationClient, Generic[AnnotationReaderType]):
                 return []
             else:
                 raise error
-        if self.session.version.is_sc_1_1 or self.session.version.is_sc_mvp:
+        if self._is_legacy_version:
             annotations = response
         else:
             annotations = response["video_annotations"]
@@ -62,7 +63,10 @@ class AnnotationClient(BaseAnnotationClient, Generic[AnnotationReaderType]):
         ]
 
     def upload_annotations_for_video(
-        self, video: Video, append_annotations: bool = False
+        self,
+        video: Video,
+        append_annotations: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ):
         """
         Upload annotations for a video. If append_annotations is set to True,
@@ -71,6 +75,8 @@ class AnnotationClient(BaseAnnotationClient, Generic[AnnotationReaderType]):
 
         :param video: Video to upload annotations for
         :param append_annotations:
+        :param max_workers: Maximum number of annotation uploads that will be made
+            concurrently
         :return:
         """
         annotation_filenames = self.annotation_reader.get_data_filenames()
@@ -86,23 +92,18 @@ class AnnotationClient(BaseAnnotationClient, Generic[AnnotationReaderType]):
                 for frame_index in frame_indices
             ]
         )
-        upload_count = 0
-        with logging_redirect_tqdm(tqdm_class=tqdm):
-            for frame in tqdm(video_frames, desc="Uploading video frame annotations"):
-                if not append_annotations:
-                    response = self._upload_annotation_for_2d_media_item(
-                        media_item=frame
-                    )
-                else:
-                    response = self._append_annotation_for_2d_media_item(
-                        media_item=frame
-                    )
-                if response.annotations:
-                    upload_count += 1
-        return upload_count
+        return self._upload_annotations_for_2d_media_list(
+            media_list=video_frames,
+            append_annotations=append_annotations,
+            max_workers=max_workers,
+            description="Uploading video frame annotations",
+        )
 
     def upload_annotations_for_videos(
-        self, videos: Sequence[Video], append_annotations: bool = False
+        self,
+        videos: Sequence[Video],
+        append_annotations: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ):
         """
         Upload annotations for a list of videos. If append_annotations is set to True,
@@ -111,13 +112,17 @@ class AnnotationClient(BaseAnnotationClient, Generic[AnnotationReaderType]):
 
         :param videos: List of videos to upload annotations for
         :param append_annotations:
+        :param max_workers: Maximum number of annotation uploads that will be made
+            concurrently
         :return:
         """
         logging.info("Starting video annotation upload...")
         upload_count = 0
         for video in videos:
             upload_count += self.upload_annotations_for_video(
-                video=video, append_annotations=append_annotations
+                video=video,
+                append_annotations=append_annotations,
+                max_workers=max_workers,
             )
         if upload_count > 0:
             logging.info(
@@ -127,7 +132,10 @@ class AnnotationClient(BaseAnnotationClient, Generic[AnnotationReaderType]):
             logging.info("No new video frame annotations were found.")
 
     def upload_annotations_for_images(
-        self, images: Sequence[Image], append_annotations: bool = False
+        self,
+        images: Sequence[Image],
+        append_annotations: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ):
         """
         Upload annotations for a list of images. If append_annotations is set to True,
@@ -136,24 +144,17 @@ class AnnotationClient(BaseAnnotationClient, Generic[AnnotationReaderType]):
 
         :param images: List of images to upload annotations for
         :param append_annotations:
+        :param max_workers: Maximum number of annotation uploads that will be made
+            concurrently
         :return:
         """
         logging.info("Starting image annotation upload...")
-        upload_count = 0
-
-        tqdm_prefix = "Uploading image annotations"
-        with logging_redirect_tqdm(tqdm_class=tqdm):
-            for image in tqdm(images, desc=tqdm_prefix):
-                if not append_annotations:
-                    response = self._upload_annotation_for_2d_media_item(
-                        media_item=image
-                    )
-                else:
-                    response = self._append_annotation_for_2d_media_item(
-                        media_item=image
-                    )
-                if response.annotations:
-                    upload_count += 1
+        upload_count = self._upload_annotations_for_2d_media_list(
+            media_list=images,
+            append_annotations=append_annotations,
+            max_workers=max_workers,
+            description="Uploading image annotations",
+        )
         if upload_count > 0:
             logging.info(
                 f"Upload complete. Uploaded {upload_count} new image annotations"
@@ -162,7 +163,11 @@ class AnnotationClient(BaseAnnotationClient, Generic[AnnotationReaderType]):
             logging.info("No new image annotations were found.")
 
     def download_annotations_for_video(
-        self, video: Video, path_to_folder: str, append_video_uid: bool = False
+        self,
+        video: Video,
+        path_to_folder: str,
+        append_video_uid: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> float:
         """
         Download video annotations from the server to a target folder on disk.
@@ -175,6 +180,8 @@ class AnnotationClient(BaseAnnotationClient, Generic[AnnotationReaderType]):
              videos with duplicate filenames. If left as False, the video filename and
              frame index for the annotation are used as filename for the downloaded
              annotation.
+        :param max_workers: Maximum number of annotation requests to the server that
+            will be made concurrently
         :return: Returns the time elapsed to download the annotations, in seconds
         """
         annotations = self.get_latest_annotations_for_video(video=video)
@@ -192,6 +199,7 @@ class AnnotationClient(BaseAnnotationClient, Generic[AnnotationReaderType]):
                 path_to_folder=path_to_folder,
                 verbose=False,
                 append_media_uid=append_video_uid,
+                max_workers=max_workers,
             )
         else:
             return 0
@@ -201,6 +209,7 @@ class AnnotationClient(BaseAnnotationClient, Generic[AnnotationReaderType]):
         images: MediaList[Image],
         path_to_folder: str,
         append_image_uid: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> float:
         """
         Download image annotations from the server to a target folder on disk.
@@ -212,12 +221,15 @@ class AnnotationClient(BaseAnnotationClient, Generic[AnnotationReaderType]):
              i.e. '{filename}_{media_id}'). This can be useful if the project contains
              images with duplicate filenames. If left as False, the image filename is
              used as filename for the downloaded annotation as well.
+        :param max_workers: Maximum number of annotation requests to the server that
+            will be made concurrently
         :return: Returns the time elapsed to download the annotations, in seconds
         """
         return self._download_annotations_for_2d_media_list(
             media_list=images,
             path_to_folder=path_to_folder,
             append_media_uid=append_image_uid,
+            max_workers=max_workers,
         )
 
     def download_annotations_for_videos(
@@ -225,6 +237,7 @@ class AnnotationClient(BaseAnnotationClient, Generic[AnnotationReaderType]):
         videos: MediaList[Video],
         path_to_folder: str,
         append_video_uid: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> float:
         """
         Download annotations for a list of videos from the server to a target folder
@@ -238,6 +251,8 @@ class AnnotationClient(BaseAnnotationClient, Generic[AnnotationReaderType]):
              videos with duplicate filenames. If left as False, the video filename and
              frame index for the annotation are used as filename for the downloaded
              annotation.
+        :param max_workers: Maximum number of annotation requests to the server that
+            will be made concurrently
         :return: Time elapsed to download the annotations, in seconds
         """
         t_total = 0
@@ -250,15 +265,20 @@ class AnnotationClient(BaseAnnotationClient, Generic[AnnotationReaderType]):
                 video=video,
                 path_to_folder=path_to_folder,
                 append_video_uid=append_video_uid,
+                max_workers=max_workers,
             )
         logging.info(f"Video annotation download finished in {t_total:.1f} seconds.")
         return t_total
 
-    def download_all_annotations(self, path_to_folder: str) -> None:
+    def download_all_annotations(
+        self, path_to_folder: str, max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> None:
         """
         Download all annotations for the project to a target folder on disk.
 
         :param path_to_folder: Folder to save the annotations to
+        :param max_workers: Maximum number of annotation requests to the server that
+            will be made concurrently
         """
         image_list = self._get_all_media_by_type(media_type=Image)
         video_list = self._get_all_media_by_type(media_type=Video)
@@ -267,15 +287,19 @@ class AnnotationClient(BaseAnnotationClient, Generic[AnnotationReaderType]):
                 images=image_list,
                 path_to_folder=path_to_folder,
                 append_image_uid=image_list.has_duplicate_filenames,
+                max_workers=max_workers,
             )
         if len(video_list) > 0:
             self.download_annotations_for_videos(
                 video_list,
                 path_to_folder=path_to_folder,
                 append_video_uid=video_list.has_duplicate_filenames,
+                max_workers=max_workers,
             )
 
-    def upload_annotations_for_all_media(self, append_annotations: bool = False):
+    def upload_annotations_for_all_media(
+        self, append_annotations: bool = False, max_workers: int = DEFAULT_MAX_WORKERS
+    ):
         """
         Upload annotations for all media in the project, If append_annotations is set
         to True, annotations will be appended to the existing annotations for the
@@ -284,16 +308,22 @@ class AnnotationClient(BaseAnnotationClient, Generic[AnnotationReaderType]):
         :param append_annotations: True to append annotations from the local disk to
             the existing annotations on the server, False to overwrite the server
             annotations by those on the local disk. Defaults to True
+        :param max_workers: Maximum number of annotation uploads that will be made
+            concurrently
         """
         image_list = self._get_all_media_by_type(media_type=Image)
         video_list = self._get_all_media_by_type(media_type=Video)
         if len(image_list) > 0:
             self.upload_annotations_for_images(
-                images=image_list, append_annotations=append_annotations
+                images=image_list,
+                append_annotations=append_annotations,
+                max_workers=max_workers,
             )
         if len(video_list) > 0:
             self.upload_annotations_for_videos(
-                videos=video_list, append_annotations=append_annotations
+                videos=video_list,
+                append_annotations=append_annotations,
+                max_workers=max_workers,
             )
 
     def upload_annotation(
@@ -317,6 +347,43 @@ class AnnotationClient(BaseAnnotationClient, Generic[AnnotationReaderType]):
             media_item=media_item, annotation_scene=annotation_scene
         )
 
+    def upload_annotations(
+        self,
+        media_items: Sequence[Union[Image, VideoFrame]],
+        annotation_scenes: Sequence[AnnotationScene],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> List[AnnotationScene]:
+        """
+        Upload annotations for a list of images or video frames to the Intel® Geti™
+        server. The annotation scene at a certain position in `annotation_scenes` is
+        applied to the media item at the same position in `media_items`.
+
+        :param media_items: List of Images or VideoFrames to apply and upload the
+            annotations to
+        :param annotation_scenes: List of AnnotationScenes to upload
+        :param max_workers: Maximum number of annotation uploads that will be made
+            concurrently
+        :return: List of the uploaded annotations
+        """
+        if len(media_items) != len(annotation_scenes):
+            raise ValueError(
+                f"Unable to upload annotations: Received {len(media_items)} media "
+                f"items but {len(annotation_scenes)} annotation scenes. Please make "
+                f"sure to pass exactly one annotation scene per media item."
+            )
+        for media_item in media_items:
+            if not isinstance(media_item, (Image, VideoFrame)):
+                raise ValueError(
+                    f"Cannot upload annotation for media item {media_item.name}. This "
+                    f"method only supports uploading annotations for images and "
+                    f"video frames. Please use the method "
+                    f"`upload_annotations_for_video` to upload video annotations"
+                )
+        return self._upload_annotations_bulk(
+            media_scenes=list(zip(media_items, annotation_scenes)),
+            max_workers=max_workers,
+        )
+
     def get_annotation(
         self, media_item: Union[Image, VideoFrame]
     ) -> Optional[AnnotationScene]:
@@ -12,12 +12,29 @@
 # See the License for the specific language governing permissions
 # and limitations under the License.
 
-import json
 import logging
 import os
+import sys
+import threading
 import time
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
+import orjson
 from tqdm.auto import tqdm
 from tqdm.contrib.logging import logging_redirect_tqdm
 
@@ -39,10 +56,215 @@ from geti_sdk.rest_converters import AnnotationRESTConverter
 from geti_sdk.rest_converters.annotation_rest_converter import (
     NormalizedAnnotationRESTConverter,
 )
+from geti_sdk.utils.concurrency_helpers import run_concurrently
 
 AnnotationReaderType = TypeVar("AnnotationReaderType", bound=AnnotationReader)
 MediaType = TypeVar("MediaType", Image, Video)
 
+DEFAULT_MAX_WORKERS = 16
+
+# AnnotationScene fields that should not be sent when posting a new annotation
+UPLOAD_EXCLUDED_FIELDS = frozenset({"kind"})
+APPEND_EXCLUDED_FIELDS = frozenset({"kind", "annotation_state_per_task", "id"})
+
+
+def _is_interactive_output() -> bool:
+    """
+    Return True if progress bars are shown to a user, i.e. when the progress
+    output goes to a terminal or the code runs in a Jupyter notebook. Return False
+    for headless runs, for example in CI pipelines where the output is redirected
+    to a log file.
+
+    :return: True if the progress output is shown interactively, False otherwise
+    """
+    return sys.stderr.isatty() or "ipykernel" in sys.modules
+
+
+def _progress_bar(iterable, total: int, description: str) -> tqdm:
+    """
+    Wrap `iterable` in a tqdm progress bar. For headless runs, the progress bar is
+    refreshed at most every few seconds and roughly once per percent of progress,
+    to avoid flooding the logs with progress output.
+
+    :param iterable: Iterable to track the progress for
+    :param total: Total number of items in the iterable
+    :param description: Description to show in the progress bar
+    :return: tqdm progress bar wrapping the iterable
+    """
+    if _is_interactive_output():
+        return tqdm(iterable, total=total, desc=description)
+    return tqdm(
+        iterable,
+        total=total,
+        desc=description,
+        mininterval=5.0,
+        maxinterval=10.0,
+        miniters=max(1, total // 100),
+    )
+
+
+def _redirect_logging_to_progress_bar() -> ContextManager:
+    """
+    Return a context manager that redirects log output through tqdm, so that it
+    does not break up the progress bar. For headless runs there is no progress bar
+    to protect, so a no-op context manager is returned.
+
+    :return: Context manager to wrap the code that shows the progress bar
+    """
+    if _is_interactive_output():
+        return logging_redirect_tqdm(tqdm_class=tqdm)
+    return nullcontext()
+
+
+def _annotation_scene_to_rest(
+    annotation_scene: AnnotationScene,
+    media_information: MediaInformation,
+    exclude: FrozenSet[str] = frozenset(),
+) -> Dict[str, Any]:
+    """
+    Convert an AnnotationScene to its REST representation, keeping any IDs.
+
+    :param annotation_scene: AnnotationScene to convert
+    :param media_information: MediaInformation for the media item to which the
+        annotation applies. Not used for this representation, but accepted so that
+        both conversion functions have the same signature
+    :param exclude: Names of top level AnnotationScene fields to leave out
+    :return: Dictionary holding the REST representation of the annotation scene
+    """
+    return AnnotationRESTConverter.to_dict(
+        annotation_scene, deidentify=False, exclude=exclude
+    )
+
+
+def _annotation_scene_to_normalized_rest(
+    annotation_scene: AnnotationScene,
+    media_information: MediaInformation,
+    exclude: FrozenSet[str] = frozenset(),
+) -> Dict[str, Any]:
+    """
+    Convert an AnnotationScene to its legacy REST representation in normalized
+    coordinates, keeping any IDs.
+
+    :param annotation_scene: AnnotationScene to convert
+    :param media_information: MediaInformation for the media item to which the
+        annotation applies, used to normalize the coordinates
+    :param exclude: Names of top level AnnotationScene fields to leave out
+    :return: Dictionary holding the legacy REST representation of the annotation
+        scene
+    """
+    return NormalizedAnnotationRESTConverter.to_normalized_dict(
+        annotation_scene,
+        deidentify=False,
+        image_width=media_information.width,
+        image_height=media_information.height,
+        exclude=exclude,
+    )
+
+
+def _annotation_scene_from_rest(
+    response_dict: Dict[str, Any], media_information: MediaInformation
+) -> AnnotationScene:
+    """
+    Create an AnnotationScene from its REST representation.
+
+    :param response_dict: Dictionary holding the REST representation of the
+        annotation scene
+    :param media_information: MediaInformation for the media item to which the
+        annotation applies. Not used for this representation, but accepted so that
+        both conversion functions have the same signature
+    :return: AnnotationScene corresponding to the data in `response_dict`
+    """
+    return AnnotationRESTConverter.from_dict(response_dict)
+
+
+def _annotation_scene_from_normalized_rest(
+    response_dict: Dict[str, Any], media_information: MediaInformation
+) -> AnnotationScene:
+    """
+    Create an AnnotationScene from its legacy REST representation in normalized
+    coordinates.
+
+    :param response_dict: Dictionary holding the legacy REST representation of the
+        annotation scene
+    :param media_information: MediaInformation for the media item to which the
+        annotation applies, used to convert the coordinates to pixels
+    :return: AnnotationScene corresponding to the data in `response_dict`
+    """
+    return NormalizedAnnotationRESTConverter.normalized_annotation_scene_from_dict(
+        response_dict,
+        image_width=media_information.width,
+        image_height=media_information.height,
+    )
+
+
+def _annotation_filename(media_item: Union[Image, VideoFrame]) -> str:
+    """
+    Return the filename for the annotation file of `media_item`.
+
+    :param media_item: Image or VideoFrame to get the annotation filename for
+    :return: Filename for the annotation file
+    """
+    return f"{os.path.basename(media_item.name)}.json"
+
+
+def _image_annotation_filename_with_uid(image: Image) -> str:
+    """
+    Return the filename for the annotation file of `image`, including the image UID.
+
+    :param image: Image to get the annotation filename for
+    :return: Filename for the annotation file
+    """
+    return f"{os.path.basename(image.name)}_{image.id}.json"
+
+
+def _video_frame_annotation_filename_with_uid(video_frame: VideoFrame) -> str:
+    """
+    Return the filename for the annotation file of `video_frame`, including the UID
+    of the video the frame belongs to and the frame index.
+
+    :param video_frame: VideoFrame to get the annotation filename for
+    :return: Filename for the annotation file
+    """
+    if video_frame.video_name is not None:
+        video_name = os.path.basename(video_frame.video_name)
+    else:
+        video_name = os.path.basename(video_frame.name).split("_frame_")[0]
+    media_information = video_frame.media_information
+    return (
+        f"{video_name}_{media_information.video_id}_frame_"
+        f"{media_information.frame_index}.json"
+    )
+
+
+def _write_annotation_file(annotation_scene: AnnotationScene, filepath: str) -> None:
+    """
+    Write the annotation data in `annotation_scene` to a json file at `filepath`.
+    The unique database ID fields are removed from the annotation data.
+
+    The data is written to a temporary file next to `filepath` first, which is then
+    moved into place. Annotation files are written from multiple threads, and media
+    items with duplicate names map to the same filepath, so this makes sure that the
+    file at `filepath` always holds the complete data from one of the writes.
+
+    :param annotation_scene: AnnotationScene to write to file
+    :param filepath: Path of the json file to write
+    """
+    export_data = AnnotationRESTConverter.to_dict(annotation_scene)
+    temporary_filepath = f"{filepath}.{threading.get_ident()}.tmp"
+    try:
+        with open(temporary_filepath, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    export_data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                )
+            )
+        os.replace(temporary_filepath, filepath)
+    except BaseException:
+        if os.path.exists(temporary_filepath):
+            os.remove(temporary_filepath)
+        raise
+
 
 class BaseAnnotationClient:
     """
@@ -68,6 +290,18 @@ class BaseAnnotationClient:
         self._dataset_client = DatasetClient(
             session=session, project=project, workspace_id=workspace_id
         )
+        self._datasets_cache: Optional[List[Dataset]] = None
+        # Legacy platform versions use normalized coordinates in the annotation REST
+        # representation, and return video annotations as a plain list. The server
+        # version does not change during the lifetime of the client, so the
+        # conversion functions are selected only once
+        self._is_legacy_version = session.version.is_sc_mvp or session.version.is_sc_1_1
+        if self._is_legacy_version:
+            self._to_rest = _annotation_scene_to_normalized_rest
+            self._from_rest = _annotation_scene_from_normalized_rest
+        else:
+            self._to_rest = _annotation_scene_to_rest
+            self._from_rest = _annotation_scene_from_rest
 
     def _get_all_media_by_type(
         self, media_type: Type[MediaType]
@@ -78,7 +312,9 @@ class BaseAnnotationClient:
         :param media_type: Type of media item to retrieve. Can be 'Image' or 'Video'
         :return: MediaList holding all media of a certain type in the project
         """
-        datasets = self._dataset_client.get_all_datasets()
+        if self._datasets_cache is None:
+            self._datasets_cache = self._dataset_client.get_all_datasets()
+        datasets = self._datasets_cache
         media_list = MediaList[media_type]([])
         for dataset in datasets:
             media_list.extend(
@@ -88,6 +324,15 @@ class BaseAnnotationClient:
             )
         return media_list
 
+    def invalidate_datasets_cache(self) -> None:
+        """
+        Clear the list of datasets in the project that is cached by the annotation
+        client. This should be called when datasets are added to or removed from the
+        project after the annotation client was created, to make sure that the
+        annotations for all datasets are up- or downloaded.
+        """
+        self._datasets_cache = None
+
     def _get_all_media_in_dataset_by_type(
         self, media_type: Type[MediaType], dataset: Dataset
     ) -> MediaList[MediaType]:
@@ -111,17 +356,33 @@ class BaseAnnotationClient:
         )
         response = self.session.get_rest_response(url=get_media_url, method="GET")
         total_number_of_media: int = response["media_count"][media_name]
-        raw_media_list: List[Dict[str, Any]] = []
-        while len(raw_media_list) < total_number_of_media:
-            for media_item_dict in response["media"]:
-                raw_media_list.append(media_item_dict)
-            if "next_page" in response.keys():
-                response = self.session.get_rest_response(
-                    url=response["next_page"], method="GET"
+        media_list = MediaList[media_type]([])
+        # The media endpoint paginates via a server-provided `next_page` url, so pages
+        # cannot be requested out of order. Instead, the next page is requested in the
+        # background as soon as its url is known, while the current page is converted.
+        # Converting page by page means that only the raw data for the current and
+        # the next page is held in memory at any time
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            while True:
+                # The response for an empty dataset may not contain any media
+                page = response.pop("media", [])
+                next_page_url = response.get("next_page", None)
+                if (
+                    next_page_url is not None
+                    and len(media_list) + len(page) < total_number_of_media
+                ):
+                    next_response = executor.submit(
+                        self.session.get_rest_response, url=next_page_url, method="GET"
+                    )
+                else:
+                    next_response = None
+                media_list.extend(
+                    MediaList.from_rest_list(rest_input=page, media_type=media_type)
                 )
-        return MediaList.from_rest_list(
-            rest_input=raw_media_list, media_type=media_type
-        )
+                if next_response is None:
+                    break
+                response = next_response.result()
+        return media_list
 
     def __get_label_mapping(self, project: Project) -> Dict[str, str]:
         """
@@ -151,9 +412,10 @@ class BaseAnnotationClient:
 
         :return:
         """
+        if self._label_mapping is not None:
+            return self._label_mapping
         if self.annotation_reader is not None:
-            if self._label_mapping is None:
-                self._label_mapping = self.__get_label_mapping(self._project)
+            self._label_mapping = self.__get_label_mapping(self._project)
             return self._label_mapping
         else:
             raise ValueError(
@@ -202,24 +464,34 @@ class BaseAnnotationClient:
                     "defined for the AnnotationClient. Therefore, the "
                     "AnnotationClient is unable to upload any annotation data."
                 )
-        if scene_to_upload.has_data:
-            scene_to_upload.prepare_for_post()
-            if self.session.version.is_sc_mvp or self.session.version.is_sc_1_1:
-                rest_data = NormalizedAnnotationRESTConverter.to_normalized_dict(
-                    scene_to_upload,
-                    deidentify=False,
-                    image_width=media_item.media_information.width,
-                    image_height=media_item.media_information.height,
-                )
-            else:
-                rest_data = AnnotationRESTConverter.to_dict(
-                    scene_to_upload, deidentify=False
-                )
-            rest_data.pop("kind")
+        return self._post_annotation_for_2d_media_item(
+            media_item=media_item, annotation_scene=scene_to_upload
+        )
+
+    def _post_annotation_for_2d_media_item(
+        self, media_item: Union[Image, VideoFrame], annotation_scene: AnnotationScene
+    ) -> AnnotationScene:
+        """
+        Post the `annotation_scene` for an image or video frame to the cluster. This
+        will overwrite any current annotations for the media item. Nothing is posted
+        if the annotation scene does not contain any annotations.
+
+        :param media_item: Image or VideoFrame to upload the annotation for
+        :param annotation_scene: AnnotationScene to upload. The media identifier of
+            the scene should already be set to that of the `media_item`
+        :return: AnnotationScene that was uploaded
+        """
+        if annotation_scene.has_data:
+            annotation_scene.prepare_for_post()
+            rest_data = self._to_rest(
+                annotation_scene,
+                media_item.media_information,
+                exclude=UPLOAD_EXCLUDED_FIELDS,
+            )
             self.session.get_rest_response(
                 url=f"{media_item.base_url}/annotations", method="POST", data=rest_data
             )
-        return scene_to_upload
+        return annotation_scene
 
     def annotation_scene_from_rest_response(
         self, response_dict: Dict[str, Any], media_information: MediaInformation
@@ -233,17 +505,7 @@ class BaseAnnotationClient:
             annotation applies
         :return: AnnotationScene object corresponding to the data in the response_dict
         """
-        if self.session.version.is_sc_mvp or self.session.version.is_sc_1_1:
-            annotation_scene = (
-                NormalizedAnnotationRESTConverter.normalized_annotation_scene_from_dict(
-                    response_dict,
-                    image_width=media_information.width,
-                    image_height=media_information.height,
-                )
-            )
-        else:
-            annotation_scene = AnnotationRESTConverter.from_dict(response_dict)
-        return annotation_scene
+        return self._from_rest(response_dict, media_information)
 
     def _append_annotation_for_2d_media_item(
         self, media_item: Union[Image, VideoFrame]
@@ -251,18 +513,48 @@ class BaseAnnotationClient:
         """
         Add an annotation to the existing annotations for the `media_item`.
 
+        If the annotation source does not contain any annotations for the media
+        item, the existing annotations are left untouched and no requests are made
+        to the server.
+
         :param media_item: Image or VideoFrame to append the annotation for
         :return: Returns the response of the REST endpoint to post the updated
-            annotation
+            annotation, or the empty annotation read from the source if there was
+            nothing to append
         """
         new_annotation_scene = self._read_2d_media_annotation_from_source(
             media_item=media_item, preserve_shape_for_global_labels=True
         )
+        return self._post_appended_annotation_for_2d_media_item(
+            media_item=media_item, new_annotation_scene=new_annotation_scene
+        )
+
+    def _post_appended_annotation_for_2d_media_item(
+        self,
+        media_item: Union[Image, VideoFrame],
+        new_annotation_scene: AnnotationScene,
+    ) -> AnnotationScene:
+        """
+        Add the annotations in `new_annotation_scene` to the existing annotations for
+        the `media_item` on the cluster.
+
+        If the `new_annotation_scene` does not contain any annotations, the existing
+        annotations are left untouched and no requests are made to the server.
+
+        :param media_item: Image or VideoFrame to append the annotation for
+        :param new_annotation_scene: AnnotationScene holding the annotations to
+            append
+        :return: Returns the response of the REST endpoint to post the updated
+            annotation, or the `new_annotation_scene` if there was nothing to append
+        """
+        if not new_annotation_scene.has_data:
+            return new_annotation_scene
         annotation_scene = self._get_latest_annotation_for_2d_media_item(media_item)
         if annotation_scene is None:
             logging.info(
-                f"No existing annotation found for {str(media_item.type)} named "
-                f"{media_item.name}"
+                "No existing annotation found for %s named %s",
+                media_item.type,
+                media_item.name,
             )
             annotation_scene = AnnotationScene(
                 media_identifier=media_item.identifier,
@@ -272,20 +564,11 @@ class BaseAnnotationClient:
         annotation_scene.extend(new_annotation_scene.annotations)
 
         if annotation_scene.has_data:
-            if self.session.version.is_sc_mvp or self.session.version.is_sc_1_1:
-                rest_data = NormalizedAnnotationRESTConverter.to_normalized_dict(
-                    annotation_scene,
-                    deidentify=False,
-                    image_width=media_item.media_information.width,
-                    image_height=media_item.media_information.height,
-                )
-            else:
-                rest_data = AnnotationRESTConverter.to_dict(
-                    annotation_scene, deidentify=False
-                )
-            rest_data.pop("kind", None)
-            rest_data.pop("annotation_state_per_task", None)
-            rest_data.pop("id", None)
+            rest_data = self._to_rest(
+                annotation_scene,
+                media_item.media_information,
+                exclude=APPEND_EXCLUDED_FIELDS,
+            )
             response = self.session.get_rest_response(
                 url=f"{media_item.base_url}/annotations", method="POST", data=rest_data
             )
@@ -320,6 +603,7 @@ class BaseAnnotationClient:
         self,
         media_item: Union[Image, VideoFrame],
         preserve_shape_for_global_labels: bool = False,
+        label_mapping: Optional[Dict[str, str]] = None,
     ) -> AnnotationScene:
         """
         Retrieve the annotation for the media_item, and return it in the
@@ -327,11 +611,15 @@ class BaseAnnotationClient:
         `self.annotation_reader` to get the annotation data.
 
         :param media_item: MediaItem to read the annotation for
+        :param label_mapping: Optional dictionary mapping the label names to the label
+            ids. If left as None, the `label_mapping` of the client is used
         :return: Dictionary containing the annotation, in GETi format
         """
+        if label_mapping is None:
+            label_mapping = self.label_mapping
         annotation_list = self.annotation_reader.get_data(
             filename=media_item.name,
-            label_name_to_id_mapping=self.label_mapping,
+            label_name_to_id_mapping=label_mapping,
             media_information=media_item.media_information,
             preserve_shape_for_global_labels=preserve_shape_for_global_labels,
         )
@@ -343,22 +631,123 @@ class BaseAnnotationClient:
             }
         )
 
+    def _upload_annotations_for_2d_media_list(
+        self,
+        media_list: Sequence[Union[Image, VideoFrame]],
+        append_annotations: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        description: str = "Uploading annotations",
+    ) -> int:
+        """
+        Upload the annotations for a list of images or video frames, reading the
+        annotation data from the AnnotationReader.
+
+        The annotation data is read from the AnnotationReader on the calling thread,
+        since the readers are not guaranteed to be thread safe. Only the requests to
+        the server are made concurrently, using a pool of `max_workers` threads. At
+        most twice that number of uploads are queued at any time.
+
+        :param media_list: List of images or video frames to upload annotations for
+        :param append_annotations: True to append the annotations to the existing
+            annotations on the server, False to overwrite them
+        :param max_workers: Maximum number of annotation uploads that will be made
+            concurrently
+        :param description: Description to show in the progress bar
+        :return: Number of media items for which a non-empty annotation was uploaded
+        """
+        if append_annotations:
+            post_function = self._post_appended_annotation_for_2d_media_item
+        else:
+            post_function = self._post_annotation_for_2d_media_item
+        # Resolve the label mapping once before any work is started, rather than
+        # lazily from the annotation reader while uploads are in progress
+        label_mapping = self.label_mapping
+
+        def read_annotation_scenes() -> Iterator[
+            Tuple[Union[Image, VideoFrame], AnnotationScene]
+        ]:
+            # `run_concurrently` consumes its items on the calling thread, so the
+            # annotation reader is never accessed from the worker threads
+            for media_item in media_list:
+                annotation_scene = self._read_2d_media_annotation_from_source(
+                    media_item=media_item,
+                    preserve_shape_for_global_labels=append_annotations,
+                    label_mapping=label_mapping,
+                )
+                yield media_item, annotation_scene
+
+        upload_count = 0
+        with _redirect_logging_to_progress_bar():
+            for _, response in _progress_bar(
+                run_concurrently(
+                    lambda media_scene: post_function(*media_scene),
+                    read_annotation_scenes(),
+                    max_workers=max_workers,
+                ),
+                total=len(media_list),
+                description=description,
+            ):
+                if response.annotations:
+                    upload_count += 1
+        return upload_count
+
+    def _upload_annotations_bulk(
+        self,
+        media_scenes: Sequence[Tuple[Union[Image, VideoFrame], AnnotationScene]],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> List[AnnotationScene]:
+        """
+        Upload a list of annotation scenes, each applied to the media item it is
+        paired with. This will overwrite any current annotations for the media items.
+
+        The Intel® Geti™ REST API does not provide an endpoint to upload annotations
+        for multiple media items in a single request, so the annotations are posted
+        concurrently using a pool of `max_workers` threads instead.
+
+        :param media_scenes: List of (media_item, annotation_scene) tuples
+        :param max_workers: Maximum number of annotation uploads that will be made
+            concurrently
+        :return: List of the AnnotationScenes that were uploaded, in the same order as
+            the input
+        """
+        # The uploads complete in arbitrary order, so the results are collected by
+        # their index in the input first
+        uploaded_scenes: Dict[int, AnnotationScene] = {}
+        for index, scene in run_concurrently(
+            lambda index: self._upload_annotation_for_2d_media_item(
+                media_item=media_scenes[index][0],
+                annotation_scene=media_scenes[index][1],
+            ),
+            range(len(media_scenes)),
+            max_workers=max_workers,
+        ):
+            uploaded_scenes[index] = scene
+        return [uploaded_scenes[index] for index in range(len(media_scenes))]
+
     def _download_annotations_for_2d_media_list(
         self,
         media_list: Union[MediaList[Image], MediaList[VideoFrame]],
         path_to_folder: str,
         append_media_uid: bool = False,
         verbose: bool = True,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> float:
         """
         Download annotations from the server to a target folder on disk.
 
+        The annotations are requested from the server and written to disk
+        concurrently, using a pool of `max_workers` threads. At most twice that number
+        of downloads are queued at any time.
+
         :param media_list: List of images or video frames to download the annotations
             for
         :param path_to_folder: Folder to save the annotations to
         :param append_media_uid: True to append the UID of a media item to the
             annotation filename (separated from the original filename by an underscore,
              i.e. '{filename}_{media_id}').
+        :param verbose: True to print progress output, False to suppress output
+        :param max_workers: Maximum number of annotation requests to the server that
+            will be made concurrently
         :return: Returns the time elapsed to download the annotations, in seconds
         """
         path_to_annotations_folder = os.path.join(path_to_folder, "annotations")
@@ -366,9 +755,11 @@ class BaseAnnotationClient:
         if media_list.media_type == Image:
             media_name = "image"
             media_name_plural = "images"
+            uid_filename_function = _image_annotation_filename_with_uid
         elif media_list.media_type == VideoFrame:
             media_name = "video frame"
             media_name_plural = "video frames"
+            uid_filename_function = _video_frame_annotation_filename_with_uid
         else:
             raise ValueError(
                 "Invalid media type found in media_list, unable to download "
@@ -380,20 +771,44 @@ class BaseAnnotationClient:
                 f"{len(media_list)} {media_name_plural} to folder "
                 f"{path_to_annotations_folder}"
             )
+        make_filename = (
+            uid_filename_function if append_media_uid else _annotation_filename
+        )
         t_start = time.time()
         download_count = 0
         skip_count = 0
         tqdm_prefix = f"Downloading {media_name} annotations"
-        with logging_redirect_tqdm(tqdm_class=tqdm):
-            for media_item in tqdm(media_list, desc=tqdm_prefix):
-                annotation_scene = self._get_latest_annotation_for_2d_media_item(
-                    media_item
+
+        def download_annotation(
+            media_item: Union[Image, VideoFrame]
+        ) -> Optional[AnnotationScene]:
+            annotation_scene = self._get_latest_annotation_for_2d_media_item(media_item)
+            if (
+                annotation_scene is not None
+                and annotation_scene.kind == AnnotationKind.ANNOTATION
+            ):
+                _write_annotation_file(
+                    annotation_scene,
+                    os.path.join(path_to_annotations_folder, make_filename(media_item)),
                 )
+            return annotation_scene
+
+        with _redirect_logging_to_progress_bar():
+            for media_item, annotation_scene in _progress_bar(
+                run_concurrently(
+                    download_annotation, media_list, max_workers=max_workers
+                ),
+                total=len(media_list),
+                description=tqdm_prefix,
+            ):
                 if annotation_scene is None:
                     if verbose:
                         logging.info(
-                            f"Unable to retrieve latest annotation for {media_name} "
-                            f"{media_item.name}. Skipping this {media_name}"
+                            "Unable to retrieve latest annotation for %s %s. "
+                            "Skipping this %s",
+                            media_name,
+                            media_item.name,
+                            media_name,
                         )
                     skip_count += 1
                     continue
@@ -401,42 +816,14 @@ class BaseAnnotationClient:
                 if kind != AnnotationKind.ANNOTATION:
                     if verbose:
                         logging.info(
-                            f"Received invalid annotation of kind {kind} for {media_name} "
-                            f"with name{media_item.name}"
+                            "Received invalid annotation of kind %s for %s with name "
+                            "%s",
+                            kind,
+                            media_name,
+                            media_item.name,
                         )
                     skip_count += 1
                     continue
-                export_data = AnnotationRESTConverter.to_dict(annotation_scene)
-
-                base_media_item_name = os.path.basename(media_item.name)
-                filename = base_media_item_name + ".json"
-                if append_media_uid:
-                    if isinstance(media_item, Image):
-                        filename = f"{base_media_item_name}_{media_item.id}.json"
-                    elif isinstance(media_item, VideoFrame):
-                        if media_item.video_name is not None:
-                            base_video_name = os.path.basename(media_item.video_name)
-                            filename = (
-                                f"{base_video_name}_"
-                                f"{media_item.media_information.video_id}_frame_"
-                                f"{media_item.media_information.frame_index}.json"
-                            )
-                        else:
-                            video_name = base_media_item_name.split("_frame_")[0]
-                            filename = (
-                                f"{video_name}_"
-                                f"{media_item.media_information.video_id}_frame_"
-                                f"{media_item.media_information.frame_index}.json"
-                            )
-                    else:
-                        raise TypeError(
-                            f"Received invalid media item of type {type(media_item)}."
-                        )
-
-                annotation_path = os.path.join(path_to_annotations_folder, filename)
-
-                with open(annotation_path, "w") as f:
-                    json.dump(export_data, f, indent=4)
                 download_count += 1
         t_elapsed = time.time() - t_start
         if download_count > 0:
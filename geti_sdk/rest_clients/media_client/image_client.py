@@ -17,7 +17,7 @@ import glob
 import io
 import logging
 import os
-from typing import List, Optional, Sequence, Union
+from typing import Dict, List, Optional, Sequence, Union
 
 import cv2
 import numpy as np
@@ -30,6 +30,77 @@ from geti_sdk.rest_converters import MediaRESTConverter
 from .media_client import MEDIA_SUPPORTED_FORMAT_MAPPING, BaseMediaClient
 
 
+def _index_files_by_name(path_to_folder: str) -> Dict[str, List[str]]:
+    """
+    Walk the directory tree rooted at `path_to_folder` once, and map the name of
+    each file found to the full paths of all files with that name. Like `glob`,
+    hidden directories are not searched. Hidden files are indexed, so that they can
+    still be found when they are referred to by their full name.
+
+    :param path_to_folder: Root folder to index
+    :return: Dictionary mapping (case-normalized) filenames to lists of filepaths
+    """
+    files_by_name: Dict[str, List[str]] = {}
+    for root, directories, filenames in os.walk(path_to_folder, followlinks=True):
+        directories[:] = [
+            directory for directory in directories if not directory.startswith(".")
+        ]
+        for filename in filenames:
+            files_by_name.setdefault(os.path.normcase(filename), []).append(
+                os.path.join(root, filename)
+            )
+    return files_by_name
+
+
+def _lookup_image_name(
+    files_by_name: Dict[str, List[str]],
+    image_name: str,
+    media_formats: Sequence[str] = (),
+) -> List[str]:
+    """
+    Look up the files matching `image_name` in an index created by
+    `_index_files_by_name`. If `media_formats` are passed, the name is tried with each
+    of the extensions in turn, and the matches for the first extension that has any
+    are returned.
+
+    :param files_by_name: Dictionary mapping filenames to lists of filepaths
+    :param image_name: Name of the image to look up
+    :param media_formats: Extensions to append to the image name
+    :return: List of filepaths matching the image name
+    """
+    for media_extension in media_formats or ("",):
+        matches = files_by_name.get(
+            os.path.normcase(f"{image_name}{media_extension}"), []
+        )
+        if len(matches) > 0:
+            return matches
+    return []
+
+
+def _glob_image_name(
+    path_to_folder: str, image_name: str, media_formats: Sequence[str] = ()
+) -> List[str]:
+    """
+    Search the directory tree rooted at `path_to_folder` for files matching
+    `image_name`. If `media_formats` are passed, the name is tried with each of the
+    extensions in turn, and the matches for the first extension that has any are
+    returned.
+
+    :param path_to_folder: Root folder to search in
+    :param image_name: Name of the image to search for
+    :param media_formats: Extensions to append to the image name
+    :return: List of filepaths matching the image name
+    """
+    for media_extension in media_formats or ("",):
+        matches = glob.glob(
+            os.path.join(path_to_folder, "**", f"{image_name}{media_extension}"),
+            recursive=True,
+        )
+        if len(matches) > 0:
+            return matches
+    return []
+
+
 class ImageClient(BaseMediaClient[Image]):
     """
     Class to manage image uploads and downloads for a certain project.
@@ -66,7 +137,13 @@ class ImageClient(BaseMediaClient[Image]):
         if isinstance(image, (str, os.PathLike)):
             image_dict = self._upload(image, dataset=dataset)
         elif isinstance(image, np.ndarray):
-            image_io = io.BytesIO(cv2.imencode(".jpg", image)[1].tobytes())
+            success, encoded_image = cv2.imencode(".jpg", image)
+            if not success:
+                raise ValueError(
+                    f"Unable to encode numpy array of shape {image.shape} and dtype "
+                    f"{image.dtype} as jpeg image."
+                )
+            image_io = io.BytesIO(encoded_image)
             time_now = datetime.datetime.now()
             image_io.name = f"numpy_{time_now.strftime('%Y-%m-%dT%H-%M-%S.%f')}.jpg"
             image_dict = self._upload_bytes(image_io, dataset=dataset)
@@ -164,22 +241,20 @@ class ImageClient(BaseMediaClient[Image]):
 
         else:
             logging.debug("Retrieving full filepaths for image upload...")
+            files_by_name = _index_files_by_name(path_to_folder)
             for image_name in image_names[0:n_to_upload]:
-                if not extension_included:
-                    matches: List[str] = []
-                    for media_extension in media_formats:
-                        match_for_item = glob.glob(
-                            os.path.join(
-                                path_to_folder, "**", f"{image_name}{media_extension}"
-                            ),
-                            recursive=True,
-                        )
-                        if len(match_for_item) > 0:
-                            matches += match_for_item
-                            break
+                if os.path.dirname(image_name):
+                    # The name contains a (partial) path, fall back to searching for it
+                    matches = _glob_image_name(
+                        path_to_folder,
+                        image_name,
+                        media_formats=() if extension_included else media_formats,
+                    )
                 else:
-                    matches = glob.glob(
-                        os.path.join(path_to_folder, "**", image_name), recursive=True
+                    matches = _lookup_image_name(
+                        files_by_name,
+                        image_name,
+                        media_formats=() if extension_included else media_formats,
                     )
                 if not matches:
                     raise ValueError(
@@ -115,12 +115,12 @@ class BaseMediaClient(Generic[MediaTypeVar]):
         total_number_of_media: int = response["media_count"][self.plural_media_name]
         raw_media_list: List[Dict[str, Any]] = []
         while len(raw_media_list) < total_number_of_media:
-            for media_item_dict in response["media"]:
-                raw_media_list.append(media_item_dict)
-            if "next_page" in response.keys():
-                response = self.session.get_rest_response(
-                    url=response["next_page"], method="GET"
-                )
+            raw_media_list.extend(response["media"])
+            if "next_page" not in response.keys():
+                break
+            response = self.session.get_rest_response(
+                url=response["next_page"], method="GET"
+            )
         return MediaList.from_rest_list(
             rest_input=raw_media_list, media_type=self.__media_type
         )
@@ -191,8 +191,8 @@ class BaseMediaClient(Generic[MediaTypeVar]):
         :return: Dictionary containing the response of the Intel® Geti™ server, which
             holds the details of the uploaded entity
         """
-        media_bytes = open(filepath, "rb")
-        return self._upload_bytes(media_bytes, dataset=dataset)
+        with open(filepath, "rb") as media_bytes:
+            return self._upload_bytes(media_bytes, dataset=dataset)
 
     def _upload_loop(
         self,
@@ -216,7 +216,9 @@ class BaseMediaClient(Generic[MediaTypeVar]):
         """
         if dataset is None:
             dataset = self._project.training_dataset
-        media_in_project = self._get_all(dataset=dataset)
+        # Membership checks are done against a set of names, rather than against
+        # `MediaList.names`, which would rebuild the full list of names for every file
+        names_in_project = set(self._get_all(dataset=dataset).names)
         uploaded_media: MediaList[MediaTypeVar] = MediaList[MediaTypeVar]([])
         upload_count = 0
         skip_count = 0
@@ -229,7 +231,7 @@ class BaseMediaClient(Generic[MediaTypeVar]):
         with logging_redirect_tqdm(tqdm_class=tqdm):
             for filepath in tqdm(filepaths, desc=tqdm_prefix):
                 name, ext = os.path.splitext(os.path.basename(filepath))
-                if name in media_in_project.names and skip_if_filename_exists:
+                if name in names_in_project and skip_if_filename_exists:
                     skip_count += 1
                     continue
                 media_dict = self._upload(filepath=filepath, dataset=dataset)
@@ -238,7 +240,7 @@ class BaseMediaClient(Generic[MediaTypeVar]):
                 )
                 if isinstance(media_item, Video):
                     media_item._data = filepath
-                media_in_project.append(media_item)
+                names_in_project.add(media_item.name)
                 uploaded_media.append(media_item)
                 upload_count += 1
 
@@ -13,7 +13,7 @@
 # and limitations under the License.
 
 import copy
-from typing import Any, Dict, List, cast
+from typing import Any, Callable, Dict, FrozenSet, List, cast
 
 import attr
 from omegaconf import OmegaConf
@@ -55,6 +55,28 @@ MEDIA_IDENTIFIER_MAPPING = {
 }
 
 
+def _annotation_scene_field_filter(
+    annotation_scene: AnnotationScene, exclude: FrozenSet[str]
+) -> Callable[[attr.Attribute, Any], bool]:
+    """
+    Return a filter for `attr.asdict` that skips the top level fields of
+    `annotation_scene` with names in `exclude`. Fields with the same names in nested
+    entities (for example the `id` of an Annotation) are retained.
+
+    :param annotation_scene: AnnotationScene that is to be converted
+    :param exclude: Names of the AnnotationScene fields to skip
+    :return: Filter function to pass to `attr.asdict`
+    """
+    # Attributes compare equal by their definition, so the nested `id` fields would
+    # match as well. Compare by identity instead
+    excluded_fields = {
+        id(attribute)
+        for name, attribute in attr.fields_dict(type(annotation_scene)).items()
+        if name in exclude
+    }
+    return lambda attribute, value: id(attribute) not in excluded_fields
+
+
 class AnnotationRESTConverter:
     """
     Class to convert REST representations of annotations into AnnotationScene entities.
@@ -62,7 +84,9 @@ class AnnotationRESTConverter:
 
     @staticmethod
     def to_dict(
-        annotation_scene: AnnotationScene, deidentify: bool = True
+        annotation_scene: AnnotationScene,
+        deidentify: bool = True,
+        exclude: FrozenSet[str] = frozenset(),
     ) -> Dict[str, Any]:
         """
         Convert an AnnotationScene to a dictionary. By default, removes any ID
@@ -71,12 +95,21 @@ class AnnotationRESTConverter:
         :param annotation_scene: AnnotationScene object to convert
         :param deidentify: True to remove any unique database ID fields in the output,
             False to keep these fields. Defaults to True
+        :param exclude: Names of top level AnnotationScene fields to leave out of the
+            output dictionary, for example 'kind' or 'id'
         :return: Dictionary holding the serialized AnnotationScene data
         """
         if deidentify:
             annotation_scene.deidentify()
         annotation_dict = attr.asdict(
-            annotation_scene, recurse=True, value_serializer=attr_value_serializer
+            annotation_scene,
+            recurse=True,
+            filter=(
+                _annotation_scene_field_filter(annotation_scene, exclude)
+                if exclude
+                else None
+            ),
+            value_serializer=attr_value_serializer,
         )
         remove_null_fields(annotation_dict)
         return annotation_dict
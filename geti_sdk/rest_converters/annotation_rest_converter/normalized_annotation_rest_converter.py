@@ -13,7 +13,7 @@
 # and limitations under the License.
 
 import copy
-from typing import Any, Dict, List
+from typing import Any, Dict, FrozenSet, List
 
 import attr
 
@@ -27,7 +27,10 @@ from geti_sdk.data_models.utils import (
     str_to_shape_type,
 )
 
-from .annotation_rest_converter import AnnotationRESTConverter
+from .annotation_rest_converter import (
+    AnnotationRESTConverter,
+    _annotation_scene_field_filter,
+)
 
 
 class NormalizedAnnotationRESTConverter(AnnotationRESTConverter):
@@ -132,6 +135,7 @@ class NormalizedAnnotationRESTConverter(AnnotationRESTConverter):
         image_width: int,
         image_height: int,
         deidentify: bool = True,
+        exclude: FrozenSet[str] = frozenset(),
     ) -> Dict[str, Any]:
         """
         Convert an AnnotationScene to a dictionary. By default, removes any ID
@@ -142,12 +146,21 @@ class NormalizedAnnotationRESTConverter(AnnotationRESTConverter):
         :param image_height:
         :param deidentify: True to remove any unique database ID fields in the output,
             False to keep these fields. Defaults to True
+        :param exclude: Names of top level AnnotationScene fields to leave out of the
+            output dictionary, for example 'kind' or 'id'
         :return: Dictionary holding the serialized AnnotationScene data
         """
         if deidentify:
             annotation_scene.deidentify()
         annotation_scene_dict = attr.asdict(
-            annotation_scene, recurse=True, value_serializer=attr_value_serializer
+            annotation_scene,
+            recurse=True,
+            filter=(
+                _annotation_scene_field_filter(annotation_scene, exclude)
+                if exclude
+                else None
+            ),
+            value_serializer=attr_value_serializer,
         )
         annotations_serialized: List[Dict[str, Any]] = []
         for annotation in annotation_scene.annotations:
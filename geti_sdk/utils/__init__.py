@@ -30,6 +30,7 @@ from .label_helpers import (
     generate_segmentation_labels,
     generate_unique_label_color,
 )
+from .logging_helpers import configure_basic_stdout_logging
 from .plot_helpers import (
     show_image_with_annotation_scene,
     show_video_frames_with_annotation_scenes,
@@ -51,4 +52,5 @@ __all__ = [
     "get_server_details_from_env",
     "get_project_folder_name",
     "generate_unique_label_color",
+    "configure_basic_stdout_logging",
 ]
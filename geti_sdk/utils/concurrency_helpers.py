@@ -0,0 +1,70 @@
+# Copyright (C) 2023 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions
+# and limitations under the License.
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple, TypeVar
+
+ItemType = TypeVar("ItemType")
+ResultType = TypeVar("ResultType")
+
+
+def run_concurrently(
+    function: Callable[[ItemType], ResultType],
+    items: Iterable[ItemType],
+    max_workers: int,
+    max_pending: Optional[int] = None,
+) -> Iterator[Tuple[ItemType, ResultType]]:
+    """
+    Apply `function` to each of the `items` using a pool of `max_workers` threads,
+    and yield the (item, result) pairs in order of completion.
+
+    At most `max_pending` items are submitted to the pool at any time, so that the
+    items are consumed lazily and memory use stays bounded for long inputs. If the
+    function raises an exception for any of the items, the exception is re-raised
+    by this generator and no further items are submitted.
+
+    :param function: Callable to apply to each item
+    :param items: Iterable of items to process
+    :param max_workers: Maximum number of threads to use
+    :param max_pending: Maximum number of items that are submitted but not yet
+        yielded. Defaults to twice the number of workers
+    :return: Iterator over tuples of (item, result)
+    """
+    if max_workers < 1:
+        raise ValueError(
+            f"Invalid number of workers specified: {max_workers}. At least one "
+            f"worker is required."
+        )
+    if max_pending is None:
+        max_pending = 2 * max_workers
+    max_pending = max(max_pending, max_workers)
+
+    item_iterator = iter(items)
+    pending: Dict[Future, ItemType] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for item in item_iterator:
+                pending[executor.submit(function, item)] = item
+                if len(pending) < max_pending:
+                    continue
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future.result()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future.result()
+        finally:
+            for future in pending:
+                future.cancel()
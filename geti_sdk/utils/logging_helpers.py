@@ -0,0 +1,78 @@
+# Copyright (C) 2023 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions
+# and limitations under the License.
+
+import logging
+import sys
+import time
+from typing import Optional, Tuple, Union
+
+DEFAULT_LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Logging Formatter that formats the timestamp of a record at most once per
+    second. Records that are emitted within the same second re-use the formatted
+    date and time, and only the milliseconds are filled in per record.
+
+    The output is identical to that of the standard `logging.Formatter`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Tuple of (second, formatted time), stored as a single attribute so that
+        # it can be swapped atomically when records are emitted from multiple threads
+        self._time_cache: Tuple[int, str] = (-1, "")
+
+    def formatTime(
+        self, record: logging.LogRecord, datefmt: Optional[str] = None
+    ) -> str:
+        """
+        Return the creation time of `record` as a formatted string.
+
+        :param record: LogRecord to format the time for
+        :param datefmt: Optional date format string. If this is passed, the
+            formatting is delegated to the standard `logging.Formatter`
+        :return: String holding the formatted creation time of the record
+        """
+        if datefmt is not None:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, time_string = self._time_cache
+        if second != cached_second:
+            time_string = time.strftime(
+                self.default_time_format, self.converter(record.created)
+            )
+            self._time_cache = (second, time_string)
+        return self.default_msec_format % (time_string, record.msecs)
+
+
+def configure_basic_stdout_logging(
+    level: Union[int, str] = logging.INFO,
+    log_format: str = DEFAULT_LOG_FORMAT,
+) -> None:
+    """
+    Configure the root logger to write log messages to stdout, using a
+    `CachedTimeFormatter` to format the messages.
+
+    This does nothing if the root logger already has handlers configured.
+
+    :param level: Log level to set for the root logger
+    :param log_format: Format string for the log messages
+    """
+    if logging.root.handlers:
+        return
+    handler = logging.StreamHandler(stream=sys.stdout)
+    handler.setFormatter(CachedTimeFormatter(fmt=log_format))
+    logging.basicConfig(handlers=[handler], level=level)
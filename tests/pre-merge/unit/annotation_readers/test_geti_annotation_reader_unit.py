@@ -0,0 +1,90 @@
+# Copyright (C) 2023 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions
+# and limitations under the License.
+
+import json
+import os
+
+from pytest_mock import MockerFixture
+
+from geti_sdk.annotation_readers import GetiAnnotationReader
+
+
+def _write_annotation_file(filepath: str, label_name: str) -> None:
+    annotation_data = {
+        "annotations": [
+            {
+                "labels": [
+                    {"probability": 1.0, "name": label_name, "color": "#000000ff"}
+                ],
+                "shape": {
+                    "x": 10,
+                    "y": 20,
+                    "width": 100,
+                    "height": 200,
+                    "type": "RECTANGLE",
+                },
+            }
+        ],
+    }
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(annotation_data, f, ensure_ascii=False)
+
+
+class TestGetiAnnotationReader:
+    def test_get_all_label_names_cache(self, mocker: MockerFixture, tmp_path):
+        # Arrange
+        annotation_filepath = str(tmp_path / "image_1.json")
+        _write_annotation_file(annotation_filepath, label_name="dog")
+        annotation_reader = GetiAnnotationReader(base_data_folder=str(tmp_path))
+        read_spy = mocker.spy(annotation_reader, "_read_annotation_file")
+
+        # Act
+        label_names = annotation_reader.get_all_label_names()
+        cached_label_names = annotation_reader.get_all_label_names()
+
+        # Assert
+        assert label_names == ["dog"]
+        assert cached_label_names == ["dog"]
+        assert read_spy.call_count == 1
+
+        # Arrange
+        # Overwrite the file and make sure that its modification time changes, even
+        # on file systems with a coarse timestamp resolution
+        modified_time_ns = os.stat(annotation_filepath).st_mtime_ns
+        _write_annotation_file(annotation_filepath, label_name="cat")
+        os.utime(
+            annotation_filepath,
+            ns=(modified_time_ns + 10**9, modified_time_ns + 10**9),
+        )
+
+        # Act
+        label_names = annotation_reader.get_all_label_names()
+
+        # Assert
+        assert label_names == ["cat"]
+        assert read_spy.call_count == 2
+
+    def test_get_all_label_names_non_ascii(self, tmp_path):
+        # Arrange
+        # The file holds the label name as raw UTF-8, like the annotation files that
+        # are downloaded by the SDK
+        label_name = "Hund \u00fcber Stra\u00dfe \u72ac"
+        _write_annotation_file(str(tmp_path / "image_1.json"), label_name=label_name)
+        annotation_reader = GetiAnnotationReader(base_data_folder=str(tmp_path))
+
+        # Act
+        label_names = annotation_reader.get_all_label_names()
+
+        # Assert
+        assert label_names == [label_name]
@@ -0,0 +1,79 @@
+# Copyright (C) 2023 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions
+# and limitations under the License.
+
+from pytest_mock import MockerFixture
+
+
+class TestGetiSession:
+    def test_reauthentication_once_per_expiry(
+        self, mocker: MockerFixture, fxt_mocked_session_factory
+    ):
+        # Arrange
+        session = fxt_mocked_session_factory()
+        mock_authenticate = mocker.patch.object(session, "authenticate")
+        success_response = mocker.MagicMock(status_code=200)
+        mock_request = mocker.patch.object(
+            session, "request", return_value=success_response
+        )
+        expired_response = mocker.MagicMock(status_code=401)
+        generation = session._authentication_generation
+
+        # Act
+        # Two requests that were sent with the same credentials both fail, as would
+        # happen for concurrent requests when the authentication expires
+        responses = [
+            session._handle_error_response(
+                response=expired_response,
+                request_params={"method": "GET", "url": "dummy_url"},
+                request_data={},
+                authentication_generation=generation,
+            )
+            for _ in range(2)
+        ]
+
+        # Assert
+        mock_authenticate.assert_called_once_with(verbose=False)
+        assert session._authentication_generation == generation + 1
+        assert mock_request.call_count == 2
+        assert responses == [success_response, success_response]
+
+    def test_authenticate_replaces_headers(
+        self, mocker: MockerFixture, fxt_mocked_session_factory
+    ):
+        # Arrange
+        session = fxt_mocked_session_factory()
+        # Undo the mocks used to create the session, so that the actual
+        # `authenticate` method is called
+        mocker.stopall()
+        mocker.patch.object(
+            session, "_get_initial_login_url", return_value="dummy_login_url"
+        )
+        previous_response = mocker.MagicMock()
+        previous_response.cookies.get.return_value = "dummy_cookie"
+        mocker.patch.object(
+            session, "post", return_value=mocker.MagicMock(history=[previous_response])
+        )
+        headers_before = session.headers
+        headers_before_copy = headers_before.copy()
+
+        # Act
+        session.authenticate(verbose=False)
+
+        # Assert
+        # The headers may be in use by requests from other threads, so they should be
+        # replaced rather than modified in place
+        assert headers_before == headers_before_copy
+        assert session.headers is not headers_before
+        assert session.headers["Content-Type"] == "application/x-www-form-urlencoded"
+        assert session.logged_in
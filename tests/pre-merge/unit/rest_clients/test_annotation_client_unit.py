@@ -0,0 +1,263 @@
+# Copyright (C) 2023 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions
+# and limitations under the License.
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import pytest
+from pytest_mock import MockerFixture
+
+from geti_sdk.data_models import AnnotationScene, Image, Project, Video
+from geti_sdk.data_models.media import ImageInformation
+from geti_sdk.data_models.project import Dataset
+from geti_sdk.rest_clients import AnnotationClient
+from geti_sdk.rest_clients.annotation_clients.base_annotation_client import (
+    _write_annotation_file,
+)
+
+
+def _media_page_responses(
+    page_sizes: List[int],
+    media_count: int,
+    next_page_after_last: bool,
+    upload_time: str,
+) -> List[Dict[str, Any]]:
+    """
+    Return the responses of the media endpoint for a dataset holding pages of images
+    with the given sizes. The `next_page` url of each page refers to the index of the
+    next page in the list of responses.
+    """
+    responses = []
+    image_index = 0
+    for page_index, page_size in enumerate(page_sizes):
+        response: Dict[str, Any] = {"media_count": {"images": media_count}}
+        if page_size > 0:
+            response["media"] = []
+        for _ in range(page_size):
+            response["media"].append(
+                {
+                    "id": f"image_{image_index}",
+                    "name": f"image_{image_index}",
+                    "type": "image",
+                    "upload_time": upload_time,
+                    "media_information": {
+                        "display_url": "dummy_url",
+                        "height": 10,
+                        "width": 10,
+                    },
+                }
+            )
+            image_index += 1
+        if page_index < len(page_sizes) - 1 or next_page_after_last:
+            response["next_page"] = f"next_page_{page_index + 1}"
+        responses.append(response)
+    return responses
+
+
+class TestAnnotationClient:
+    def test_upload_annotations_invalid_input(
+        self,
+        mocker: MockerFixture,
+        fxt_mocked_session_factory,
+        fxt_classification_project: Project,
+        fxt_geti_image: Image,
+        fxt_geti_video: Video,
+        fxt_annotation_scene: AnnotationScene,
+    ):
+        # Arrange
+        annotation_client = AnnotationClient(
+            session=fxt_mocked_session_factory(),
+            workspace_id="dummy_workspace_id",
+            project=fxt_classification_project,
+        )
+        mock_upload_bulk = mocker.patch.object(
+            annotation_client, "_upload_annotations_bulk"
+        )
+
+        # Act and assert
+        # Number of media items does not match the number of annotation scenes
+        with pytest.raises(ValueError):
+            annotation_client.upload_annotations(
+                media_items=[fxt_geti_image, fxt_geti_image],
+                annotation_scenes=[fxt_annotation_scene],
+            )
+
+        # Videos are not supported, only images and video frames
+        with pytest.raises(ValueError):
+            annotation_client.upload_annotations(
+                media_items=[fxt_geti_image, fxt_geti_video],
+                annotation_scenes=[fxt_annotation_scene, fxt_annotation_scene],
+            )
+
+        mock_upload_bulk.assert_not_called()
+
+    def test_write_annotation_file_concurrently(
+        self, tmp_path, fxt_annotation_scene: AnnotationScene
+    ):
+        # Arrange
+        # Media items with duplicate names are written to the same annotation file,
+        # possibly at the same time from different download threads
+        empty_annotation_scene = AnnotationScene(
+            annotations=[], media_identifier=fxt_annotation_scene.media_identifier
+        )
+        annotation_scenes = [fxt_annotation_scene, empty_annotation_scene] * 50
+        filepath = str(tmp_path / "image.json")
+
+        # Act
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(
+                executor.map(
+                    lambda scene: _write_annotation_file(scene, filepath),
+                    annotation_scenes,
+                )
+            )
+
+        # Assert
+        with open(filepath, "r", encoding="utf-8") as f:
+            annotation_data = json.load(f)
+        assert len(annotation_data["annotations"]) in [
+            0,
+            len(fxt_annotation_scene.annotations),
+        ]
+        assert os.listdir(str(tmp_path)) == ["image.json"]
+
+    @pytest.mark.parametrize(
+        "page_sizes, media_count, next_page_after_last, expected_requests",
+        [
+            # Several pages, the last page has no next page
+            ([2, 2, 1], 5, False, 3),
+            # The next page is missing before the media count is reached
+            ([2], 5, False, 1),
+            # The media count is reached while there is still a next page
+            ([2, 2], 4, True, 2),
+            # Empty dataset, the response does not contain any media
+            ([0], 0, False, 1),
+        ],
+    )
+    def test_get_all_media_in_dataset_by_type(
+        self,
+        mocker: MockerFixture,
+        fxt_mocked_session_factory,
+        fxt_classification_project: Project,
+        fxt_datetime_string: str,
+        page_sizes: List[int],
+        media_count: int,
+        next_page_after_last: bool,
+        expected_requests: int,
+    ):
+        # Arrange
+        session = fxt_mocked_session_factory()
+        annotation_client = AnnotationClient(
+            session=session,
+            workspace_id="dummy_workspace_id",
+            project=fxt_classification_project,
+        )
+        responses = _media_page_responses(
+            page_sizes=page_sizes,
+            media_count=media_count,
+            next_page_after_last=next_page_after_last,
+            upload_time=fxt_datetime_string,
+        )
+
+        def get_rest_response(url: str, method: str) -> Dict[str, Any]:
+            if url.startswith("next_page_"):
+                return responses[int(url.split("_")[-1])]
+            return responses[0]
+
+        mock_get_rest_response = mocker.patch.object(
+            session, "get_rest_response", side_effect=get_rest_response
+        )
+
+        # Act
+        images = annotation_client._get_all_media_in_dataset_by_type(
+            media_type=Image, dataset=Dataset(name="dummy_dataset", id="dataset_id")
+        )
+
+        # Assert
+        assert [image.name for image in images] == [
+            f"image_{index}" for index in range(sum(page_sizes))
+        ]
+        assert mock_get_rest_response.call_count == expected_requests
+
+    def test_upload_annotations_for_2d_media_list(
+        self,
+        mocker: MockerFixture,
+        fxt_mocked_session_factory,
+        fxt_classification_project: Project,
+        fxt_rectangle_annotation_factory,
+        fxt_datetime_string: str,
+    ):
+        # Arrange
+        session = fxt_mocked_session_factory()
+        annotation_client = AnnotationClient(
+            session=session,
+            workspace_id="dummy_workspace_id",
+            project=fxt_classification_project,
+        )
+        n_images = 20
+        images = [
+            Image(
+                name=f"image_{index}",
+                id=f"image_{index}",
+                type="image",
+                upload_time=fxt_datetime_string,
+                media_information=ImageInformation(
+                    display_url=f"dummy_url/images/image_{index}/display/full",
+                    height=10,
+                    width=10,
+                ),
+            )
+            for index in range(n_images)
+        ]
+        read_thread_ids = []
+
+        def get_data(filename: str, **kwargs):
+            read_thread_ids.append(threading.get_ident())
+            # Only the images with an even index have annotations
+            if int(filename.split("_")[-1]) % 2 == 0:
+                return [fxt_rectangle_annotation_factory()]
+            return []
+
+        # The annotation reader is set after the client is created, so the label
+        # mapping is resolved lazily
+        mock_reader = mocker.MagicMock()
+        mock_reader.get_all_label_names.return_value = []
+        mock_reader.get_data.side_effect = get_data
+        annotation_client.annotation_reader = mock_reader
+        mock_get_rest_response = mocker.patch.object(session, "get_rest_response")
+
+        # Act
+        upload_count = annotation_client._upload_annotations_for_2d_media_list(
+            media_list=images, max_workers=4
+        )
+
+        # Assert
+        assert upload_count == n_images // 2
+        assert mock_get_rest_response.call_count == n_images // 2
+        # The annotation reader is only accessed from the calling thread
+        assert read_thread_ids == [threading.get_ident()] * n_images
+        mock_reader.get_all_label_names.assert_called_once()
+
+        # Arrange
+        mock_get_rest_response.side_effect = ConnectionError("Dummy error")
+
+        # Act and assert
+        # Errors raised in the worker threads are re-raised on the calling thread
+        with pytest.raises(ConnectionError):
+            annotation_client._upload_annotations_for_2d_media_list(
+                media_list=images, max_workers=4
+            )
@@ -0,0 +1,62 @@
+# Copyright (C) 2023 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions
+# and limitations under the License.
+
+import os
+
+from geti_sdk.rest_clients.media_client.image_client import (
+    _index_files_by_name,
+    _lookup_image_name,
+)
+
+
+class TestImageClient:
+    def test_index_files_by_name(self, tmp_path):
+        # Arrange
+        filepaths = [
+            os.path.join("a", "image_1.jpg"),
+            os.path.join("a", "image_2.png"),
+            os.path.join("a", "image_3.jpg"),
+            os.path.join("b", "image_3.jpg"),
+            os.path.join("b", ".image_4.jpg"),
+            os.path.join(".hidden", "image_5.jpg"),
+        ]
+        for filepath in filepaths:
+            full_path = tmp_path / filepath
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+            full_path.touch()
+        media_formats = [".jpg", ".png"]
+
+        # Act
+        files_by_name = _index_files_by_name(str(tmp_path))
+
+        # Assert
+        # Extension included in the name
+        assert _lookup_image_name(files_by_name, "image_1.jpg") == [
+            str(tmp_path / filepaths[0])
+        ]
+        assert _lookup_image_name(files_by_name, "image_1.png") == []
+        # No extension, the media formats are tried in order
+        assert _lookup_image_name(
+            files_by_name, "image_2", media_formats=media_formats
+        ) == [str(tmp_path / filepaths[1])]
+        assert _lookup_image_name(files_by_name, "image_2") == []
+        # Duplicate filenames in different folders
+        assert sorted(
+            _lookup_image_name(files_by_name, "image_3", media_formats=media_formats)
+        ) == sorted([str(tmp_path / filepaths[2]), str(tmp_path / filepaths[3])])
+        # Hidden files are indexed, but hidden directories are skipped
+        assert _lookup_image_name(files_by_name, ".image_4.jpg") == [
+            str(tmp_path / filepaths[4])
+        ]
+        assert _lookup_image_name(files_by_name, "image_5.jpg") == []
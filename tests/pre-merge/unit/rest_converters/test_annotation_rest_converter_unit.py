@@ -0,0 +1,43 @@
+# Copyright (C) 2023 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions
+# and limitations under the License.
+
+from geti_sdk.data_models import AnnotationScene
+from geti_sdk.rest_converters import AnnotationRESTConverter
+
+
+class TestAnnotationRESTConverter:
+    def test_to_dict_exclude(self, fxt_annotation_scene: AnnotationScene):
+        # Arrange
+        fxt_annotation_scene.id = "annotation_scene_id"
+        for index, annotation in enumerate(fxt_annotation_scene.annotations):
+            annotation.id = f"annotation_id_{index}"
+
+        # Act
+        annotation_rest = AnnotationRESTConverter.to_dict(
+            fxt_annotation_scene,
+            deidentify=False,
+            exclude=frozenset({"kind", "id"}),
+        )
+
+        # Assert
+        assert "kind" not in annotation_rest
+        assert "id" not in annotation_rest
+        assert "media_identifier" in annotation_rest
+        # Excluded fields are only removed at the top level of the annotation scene
+        assert [
+            annotation["id"] for annotation in annotation_rest["annotations"]
+        ] == [
+            f"annotation_id_{index}"
+            for index in range(len(fxt_annotation_scene.annotations))
+        ]
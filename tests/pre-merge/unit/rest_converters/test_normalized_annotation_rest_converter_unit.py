@@ -85,6 +85,37 @@ class TestNormalizedAnnotationRESTConverter:
         assert rect_rest["shape"]["width"] == 0.9
         assert polygon_rest["shape"]["points"][0] == {"x": 0.1, "y": 0.2}
 
+    def test_to_normalized_dict_exclude(
+        self, fxt_annotation_scene_from_normalized: AnnotationScene
+    ):
+        # Arrange
+        fxt_annotation_scene_from_normalized.id = "annotation_scene_id"
+        for index, annotation in enumerate(
+            fxt_annotation_scene_from_normalized.annotations
+        ):
+            annotation.id = f"annotation_id_{index}"
+
+        # Act
+        annotation_rest = NormalizedAnnotationRESTConverter.to_normalized_dict(
+            fxt_annotation_scene_from_normalized,
+            image_height=2000,
+            image_width=1000,
+            deidentify=False,
+            exclude=frozenset({"kind", "id"}),
+        )
+
+        # Assert
+        assert "kind" not in annotation_rest
+        assert "id" not in annotation_rest
+        assert "media_identifier" in annotation_rest
+        # Excluded fields are only removed at the top level of the annotation scene
+        assert [
+            annotation["id"] for annotation in annotation_rest["annotations"]
+        ] == [
+            f"annotation_id_{index}"
+            for index in range(len(fxt_annotation_scene_from_normalized.annotations))
+        ]
+
     def test_normalized_annotation_scene_from_dict(
         self,
         fxt_normalized_annotation_polygon_dict,
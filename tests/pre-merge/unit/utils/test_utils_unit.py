@@ -13,6 +13,7 @@
 # and limitations under the License.
 
 import copy
+import logging
 
 import pytest
 
@@ -22,6 +23,8 @@ from geti_sdk.utils import (
     generate_classification_labels,
     generate_segmentation_labels,
 )
+from geti_sdk.utils.concurrency_helpers import run_concurrently
+from geti_sdk.utils.logging_helpers import DEFAULT_LOG_FORMAT, CachedTimeFormatter
 from geti_sdk.utils.serialization_helpers import DataModelMismatchException
 
 
@@ -97,3 +100,58 @@ class TestUtils:
 
         assert len(set(label_groups)) == 1
         assert len(set(label_groups_multilabel)) == len(label_names)
+
+    def test_run_concurrently(self):
+        # Arrange
+        items = list(range(50))
+
+        def square(value: int) -> int:
+            if value < 0:
+                raise ValueError("Negative value")
+            return value**2
+
+        # Act
+        results = dict(run_concurrently(square, items, max_workers=4))
+
+        # Assert
+        assert results == {item: item**2 for item in items}
+
+        # Act and assert
+        with pytest.raises(ValueError):
+            list(run_concurrently(square, [1, 2, -1, 3], max_workers=2))
+        with pytest.raises(ValueError):
+            list(run_concurrently(square, items, max_workers=0))
+
+    def test_cached_time_formatter(self):
+        # Arrange
+        cached_formatter = CachedTimeFormatter(fmt=DEFAULT_LOG_FORMAT)
+        formatter = logging.Formatter(fmt=DEFAULT_LOG_FORMAT)
+        start_time = 1680000000.0
+        # Records within one second, across a second boundary and after a longer
+        # interval, including a record that is out of order
+        creation_times = [
+            start_time + 0.1,
+            start_time + 0.5,
+            start_time + 0.999,
+            start_time + 1.2,
+            start_time + 0.7,
+            start_time + 61.3,
+        ]
+        records = [
+            logging.makeLogRecord(
+                {
+                    "msg": f"Message {index}",
+                    "levelname": "INFO",
+                    "created": created,
+                    "msecs": (created - int(created)) * 1000,
+                }
+            )
+            for index, created in enumerate(creation_times)
+        ]
+
+        # Act
+        cached_output = [cached_formatter.format(record) for record in records]
+        expected_output = [formatter.format(record) for record in records]
+
+        # Assert
+        assert cached_output == expected_output